@@ -1,4 +1,39 @@
+import argparse
+import functools
+import itertools
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Translation table that deletes the characters a separator row is built from
+_SEPARATOR_ROW_CHARS = str.maketrans('', '', '-:|')
+
+# Patterns used by the implementations, compiled once at import time instead
+# of being looked up in the re module's cache on every call
+_BLANK_LINE_SPLIT_RE = re.compile(r'\n\s*\n')
+_SEPARATOR_LINE_RE = re.compile(r'^[\s|:-]+$')
+_ALIGNMENT_LINE_RE = re.compile(r'[|\-\s:]+')
+_DIVIDER_CELL_RE = re.compile(r'^\s*:?-{3,}:?\s*$')
+_SEPARATOR_CELL_RE = re.compile(r':?-{3,}:?')
+
+
+@functools.lru_cache(maxsize=200_000)
+def _parse_row_cached(line):
+    """
+    Split a table row into stripped cells, dropping one leading and one
+    trailing pipe. Shared by the implementations whose parse_row has exactly
+    these semantics, so a row parsed by both validation and fixing is split
+    only once. run_fixer clears it before each timed pass so no
+    implementation benefits from rows another one parsed. Returns a tuple;
+    callers copy it into a list.
+    """
+    s = line.strip()
+    if s.startswith('|'):
+        s = s[1:]
+    if s.endswith('|'):
+        s = s[:-1]
+    return tuple(cell.strip() for cell in s.split('|'))
 
 
 class Claude37_round_1:
@@ -22,12 +57,12 @@ class Claude37_round_1:
             str: The markdown text with fixed tables
         """
         # Split the text into blocks (potential tables and other content)
-        blocks = re.split(r'\n\s*\n', markdown_text)
+        blocks = _BLANK_LINE_SPLIT_RE.split(markdown_text)
         fixed_blocks = []
         
         for block in blocks:
             # Check if the block might be a table (contains pipe characters)
-            if '|' in block and any(re.search(r'[-]+', line) for line in block.split('\n') if '|' in line):
+            if '|' in block and any('-' in line for line in block.split('\n') if '|' in line):
                 fixed_block = Claude37_round_1.fix_table(block)
                 fixed_blocks.append(fixed_block)
             else:
@@ -54,7 +89,7 @@ class Claude37_round_1:
         # Identify all separator rows (lines containing only |, -, :, and spaces)
         separator_indices = [
             i for i, line in enumerate(lines) 
-            if i > 0 and re.match(r'^[\s|:-]+$', line) and '---' in line
+            if i > 0 and _SEPARATOR_LINE_RE.match(line) and '---' in line
         ]
         
         # If no separator rows, this may not be a table or it's too malformed
@@ -145,7 +180,9 @@ class Claude37_round_1:
         
         # Check for separator row
         separator_line = lines[1]
-        if not all(c in '|:- ' for c in separator_line):
+        # Deleting the separator characters leaves only spaces on a valid line;
+        # this scans the line in C instead of one character object at a time
+        if separator_line.translate(_SEPARATOR_ROW_CHARS).strip(' '):
             return False
         
         # Count columns in header
@@ -181,7 +218,7 @@ class Claude37_round_1:
         # Identify all separator rows (lines containing only |, -, :, and spaces)
         separator_indices = [
             i for i, line in enumerate(lines) 
-            if re.match(r'^[\s|:-]+$', line) and '---' in line
+            if _SEPARATOR_LINE_RE.match(line) and '---' in line
         ]
         
         # If the table has multiple separator rows or irregular structure
@@ -344,14 +381,19 @@ class Grok3_round_1:
         if current_block:
             blocks.append(current_block)
         
-        # Process each block
-        fixed_blocks = []
+        # Process each block, collecting every output line in one list so the
+        # document is joined exactly once
+        out_lines = []
         for block in blocks:
+            # Blocks are separated by a single blank line
+            if out_lines:
+                out_lines.append('')
+            
             # Count lines with pipes to determine if it's a potential table
             pipe_lines = sum(1 for line in block if '|' in line)
             if pipe_lines < 3:
                 # Not a table (fewer than 3 lines with '|'), leave unchanged
-                fixed_blocks.append('\n'.join(block))
+                out_lines.extend(block)
                 continue
             
             # Split each line into cells and find the maximum number of cells
@@ -359,16 +401,15 @@ class Grok3_round_1:
             num_columns = max(len(cells) for cells in cell_lists)
             
             # Reconstruct the table: header, separator, content rows
-            fixed_lines = []
             # Header (first line)
             header_cells = Grok3_round_1.split_row(block[0])
             if len(header_cells) < num_columns:
                 header_cells += [''] * (num_columns - len(header_cells))
-            fixed_lines.append('| ' + ' | '.join(header_cells) + ' |')
+            out_lines.append('| ' + ' | '.join(header_cells) + ' |')
             
             # Separator
             separator = '| ' + ' | '.join(['---' for _ in range(num_columns)]) + ' |'
-            fixed_lines.append(separator)
+            out_lines.append(separator)
             
             # Content rows (remaining lines)
             for line in block[1:]:
@@ -376,12 +417,9 @@ class Grok3_round_1:
                 if len(cells) < num_columns:
                     cells += [''] * (num_columns - len(cells))
                 fixed_line = '| ' + ' | '.join(cells) + ' |'
-                fixed_lines.append(fixed_line)
-            
-            fixed_blocks.append('\n'.join(fixed_lines))
+                out_lines.append(fixed_line)
         
-        # Join blocks with double newlines
-        return '\n\n'.join(fixed_blocks)
+        return '\n'.join(out_lines)
 
 
 class O1_pro_round_1:
@@ -396,7 +434,7 @@ class O1_pro_round_1:
         
         # Helper to detect if a line is "alignment only" (all dashes/pipes/colons/spaces)
         def is_alignment_line(line):
-            return bool(re.fullmatch(r'[|\-\s:]+', line.strip()))
+            return bool(_ALIGNMENT_LINE_RE.fullmatch(line.strip()))
         
         # We'll store processed lines here
         output_lines = []
@@ -528,16 +566,22 @@ class O3_mini_high_round_1:
     @staticmethod
     def fix_invalid_markdown_tables(text):
         def is_divider_row(cells):
-            pat = re.compile(r'^\s*:?-{3,}:?\s*$')
-            return all(pat.match(cell) for cell in cells if cell.strip() != '')
+            return all(_DIVIDER_CELL_RE.match(cell) for cell in cells if cell.strip() != '')
         
         def merge_block(block):
             merged = []
+            # Continuation text for merged[-1], joined once when the row ends
+            continuation = []
             for line in block:
                 if '|' in line:
+                    if continuation:
+                        merged[-1] = ' '.join([merged[-1]] + continuation)
+                        continuation = []
                     merged.append(line.rstrip())
                 elif merged and line.strip():
-                    merged[-1] += ' ' + line.strip()
+                    continuation.append(line.strip())
+            if continuation:
+                merged[-1] = ' '.join([merged[-1]] + continuation)
             return merged
         
         def process_table_block(block):
@@ -712,7 +756,7 @@ class Claude37_round_2:
         """
         if not cells:
             return False
-        return all(re.fullmatch(r':?-{3,}:?', cell.strip()) for cell in cells if cell.strip())
+        return all(_SEPARATOR_CELL_RE.fullmatch(cell.strip()) for cell in cells if cell.strip())
     
     @staticmethod
     def normalize_row(row, target_cols):
@@ -852,7 +896,7 @@ class Grok3_round_2:
         """
         Check if cells form a separator row.
         """
-        return all(re.fullmatch(r':?-{3,}:?', cell) for cell in cells if cell)
+        return all(_SEPARATOR_CELL_RE.fullmatch(cell) for cell in cells if cell)
     
     @staticmethod
     def get_table_style(line):
@@ -982,23 +1026,14 @@ class O1_pro_round_2:
         """
         Parse a row into cells.
         """
-        s = line.strip()
-        has_lead = s.startswith('|')
-        has_tail = s.endswith('|')
-        
-        if has_lead:
-            s = s[1:]
-        if has_tail:
-            s = s[:-1]
-            
-        return [c.strip() for c in s.split('|')]
+        return list(_parse_row_cached(line))
     
     @staticmethod
     def is_separator_row(cells):
         """
         Check if cells form a separator row.
         """
-        return all(re.fullmatch(r':?-{3,}:?', c.strip()) for c in cells if c.strip())
+        return all(_SEPARATOR_CELL_RE.fullmatch(c.strip()) for c in cells if c.strip())
     
     @staticmethod
     def get_style(line):
@@ -1123,19 +1158,14 @@ class O3_mini_high_round_2:
         """
         Parse a row into cells.
         """
-        s = line.strip()
-        if s.startswith('|'):
-            s = s[1:]
-        if s.endswith('|'):
-            s = s[:-1]
-        return [cell.strip() for cell in s.split('|')]
+        return list(_parse_row_cached(line))
     
     @staticmethod
     def is_separator_row(cells):
         """
         Check if cells form a separator row.
         """
-        return all(re.fullmatch(r':?-{3,}:?', cell) for cell in cells if cell)
+        return all(_SEPARATOR_CELL_RE.fullmatch(cell) for cell in cells if cell)
     
     @staticmethod
     def get_style(line):
@@ -1255,15 +1285,20 @@ class Claude37_round_3:
         Merge lines that might be continuations of multi-line cells.
         """
         merged = []
+        # Continuation text for merged[-1], joined once when the row ends
+        continuation = []
         for line in lines:
-            if '|' in line:
-                merged.append(line)
-            elif merged and line.strip():
+            if merged and '|' not in line and line.strip():
                 # This appears to be a continuation of the previous line
-                merged[-1] += ' ' + line.strip()
-            else:
-                # Empty line or something else
-                merged.append(line)
+                continuation.append(line.strip())
+                continue
+            if continuation:
+                merged[-1] = ' '.join([merged[-1]] + continuation)
+                continuation = []
+            # Table row, empty line or something else
+            merged.append(line)
+        if continuation:
+            merged[-1] = ' '.join([merged[-1]] + continuation)
         return merged
 
     @staticmethod
@@ -1298,7 +1333,7 @@ class Claude37_round_3:
             return False
             
         # Each cell must match the separator pattern
-        return all(re.fullmatch(r':?-{3,}:?', cell.strip()) for cell in cells if cell.strip())
+        return all(_SEPARATOR_CELL_RE.fullmatch(cell.strip()) for cell in cells if cell.strip())
 
     @staticmethod
     def parse_table_row(line):
@@ -1524,7 +1559,7 @@ class Grok3_round_3:
     @staticmethod
     def is_separator_row(cells):
         """Check if a row is a separator (e.g., |---|---|)"""
-        return all(re.fullmatch(r':?-{3,}:?', cell.strip()) for cell in cells if cell.strip())
+        return all(_SEPARATOR_CELL_RE.fullmatch(cell.strip()) for cell in cells if cell.strip())
 
     @staticmethod
     def split_row(line):
@@ -1629,17 +1664,24 @@ class O1_pro_round_3:
     def fix_invalid_markdown_tables(markdown_text):
         def merge_continuation_lines(block):
             merged = []
+            # Continuation text for merged[-1], joined once when the row ends
+            continuation = []
             for line in block:
                 stripped = line.strip()
                 if '|' in line:
                     # Start a new row
+                    if continuation:
+                        merged[-1] = ' '.join([merged[-1]] + continuation)
+                        continuation = []
                     merged.append(line)
                 else:
                     # If this line doesn't contain '|', treat it as continuation
                     if merged:
-                        merged[-1] += ' ' + stripped
+                        continuation.append(stripped)
                     else:
                         merged.append(line)
+            if continuation:
+                merged[-1] = ' '.join([merged[-1]] + continuation)
             return merged
 
         def split_into_cells(line):
@@ -1653,7 +1695,7 @@ class O1_pro_round_3:
 
         def is_alignment_row(cells):
             # True if all cells match :?-{3,}:?
-            return all(re.fullmatch(r':?-{3,}:?', c.strip()) for c in cells if c.strip())
+            return all(_SEPARATOR_CELL_RE.fullmatch(c.strip()) for c in cells if c.strip())
 
         def reassemble_row(cells, style):
             # style is a tuple (leading_pipe, trailing_pipe) from the first row
@@ -1851,7 +1893,7 @@ class O3_mini_high_round_3:
 
     @staticmethod
     def is_valid_separator_cell(cell):
-        return re.fullmatch(r':?-{3,}:?', cell.strip()) is not None
+        return _SEPARATOR_CELL_RE.fullmatch(cell.strip()) is not None
 
     @staticmethod
     def fix_table_block(lines):
@@ -2036,7 +2078,7 @@ class Claude37_round_4:
         """
         Check if a cell contains a valid separator pattern (e.g., ---, :--:).
         """
-        return bool(re.fullmatch(r':?-{3,}:?', cell.strip()))
+        return bool(_SEPARATOR_CELL_RE.fullmatch(cell.strip()))
 
     @staticmethod
     def is_separator_row(cells):
@@ -2265,11 +2307,18 @@ class Grok3_round_4:
     def merge_continuation_lines(lines):
         """Merges lines without pipes into the previous row's last cell."""
         merged = []
+        # Continuation text for merged[-1], joined once when the row ends
+        continuation = []
         for line in lines:
             if '|' in line:
+                if continuation:
+                    merged[-1] = ' '.join([merged[-1]] + continuation)
+                    continuation = []
                 merged.append(line)
             elif merged and line.strip():
-                merged[-1] += ' ' + line.strip()
+                continuation.append(line.strip())
+        if continuation:
+            merged[-1] = ' '.join([merged[-1]] + continuation)
         return merged
 
     @staticmethod
@@ -2289,7 +2338,7 @@ class Grok3_round_4:
         """Determines if a row is a separator (e.g., ---, :--, :-:)."""
         if not cells:
             return False
-        return all(re.fullmatch(r':?-{3,}:?', cell.strip()) for cell in cells if cell.strip())
+        return all(_SEPARATOR_CELL_RE.fullmatch(cell.strip()) for cell in cells if cell.strip())
 
     @staticmethod
     def is_valid_table(lines):
@@ -2410,15 +2459,10 @@ class O1_pro_round_4:
             return merged
 
         def parse_row(line):
-            s = line.strip()
-            has_lead = s.startswith('|')
-            has_tail = s.endswith('|')
-            if has_lead: s = s[1:]
-            if has_tail: s = s[:-1]
-            return [c.strip() for c in s.split('|')]
+            return list(_parse_row_cached(line))
 
         def is_separator_cell(cell):
-            return re.fullmatch(r':?-{3,}:?', cell.strip()) is not None
+            return _SEPARATOR_CELL_RE.fullmatch(cell.strip()) is not None
 
         def is_separator_row(cells):
             return all(is_separator_cell(c) for c in cells if c.strip())
@@ -2556,16 +2600,11 @@ class O3_mini_high_round_4:
 
     @staticmethod
     def parse_row(line):
-        s = line.strip()
-        if s.startswith('|'):
-            s = s[1:]
-        if s.endswith('|'):
-            s = s[:-1]
-        return [cell.strip() for cell in s.split('|')]
+        return list(_parse_row_cached(line))
 
     @staticmethod
     def is_separator_cell(cell):
-        return re.fullmatch(r':?-{3,}:?', cell.strip()) is not None
+        return _SEPARATOR_CELL_RE.fullmatch(cell.strip()) is not None
 
     @staticmethod
     def is_separator_row(cells):
@@ -2744,23 +2783,14 @@ class Claude37_round_5:
         if not line or '|' not in line:
             return []
         
-        s = line.strip()
-        has_lead = s.startswith('|')
-        has_tail = s.endswith('|')
-        
-        if has_lead:
-            s = s[1:]
-        if has_tail:
-            s = s[:-1]
-        
-        return [cell.strip() for cell in s.split('|')]
+        return list(_parse_row_cached(line))
 
     @staticmethod
     def is_separator_cell(cell):
         """
         Check if a cell contains a valid separator pattern (e.g., ---, :--:).
         """
-        return bool(re.fullmatch(r':?-{3,}:?', cell.strip()))
+        return bool(_SEPARATOR_CELL_RE.fullmatch(cell.strip()))
 
     @staticmethod
     def is_separator_row(cells):
@@ -2982,17 +3012,12 @@ class Grok3_round_5:
     @staticmethod
     def parse_row(line):
         """Parses a row into cells, removing leading/trailing pipes."""
-        s = line.strip()
-        if s.startswith('|'):
-            s = s[1:]
-        if s.endswith('|'):
-            s = s[:-1]
-        return [cell.strip() for cell in s.split('|')]
+        return list(_parse_row_cached(line))
 
     @staticmethod
     def is_separator_cell(cell):
         """Checks if a cell is a separator (e.g., ---, :--, :-:)."""
-        return re.fullmatch(r':?-{3,}:?', cell.strip()) is not None
+        return _SEPARATOR_CELL_RE.fullmatch(cell.strip()) is not None
 
     @staticmethod
     def is_separator_row(cells):
@@ -3167,14 +3192,7 @@ class O1_pro_round_5:
 
     @staticmethod
     def _parse_row(line):
-        s = line.strip()
-        has_lead = s.startswith('|')
-        has_tail = s.endswith('|')
-        if has_lead:
-            s = s[1:]
-        if has_tail:
-            s = s[:-1]
-        return [c.strip() for c in s.split('|')]
+        return list(_parse_row_cached(line))
 
     @staticmethod
     def _is_separator_row(cells):
@@ -3183,7 +3201,7 @@ class O1_pro_round_5:
 
     @staticmethod
     def _is_separator_cell(cell):
-        return re.fullmatch(r':?-{3,}:?', cell.strip()) is not None
+        return _SEPARATOR_CELL_RE.fullmatch(cell.strip()) is not None
 
     @staticmethod
     def _fix_invalid_table(lines):
@@ -3333,18 +3351,9 @@ class O3_mini_high_round_5:
         
         return merged
 
-    @staticmethod
-    def parse_row(line):
-        s = line.strip()
-        if s.startswith('|'):
-            s = s[1:]
-        if s.endswith('|'):
-            s = s[:-1]
-        return [cell.strip() for cell in s.split('|')]
-
     @staticmethod
     def is_separator_cell(cell):
-        return re.fullmatch(r':?-{3,}:?', cell.strip()) is not None
+        return _SEPARATOR_CELL_RE.fullmatch(cell.strip()) is not None
 
     @staticmethod
     def is_separator_row(cells):
@@ -3352,140 +3361,258 @@ class O3_mini_high_round_5:
             return False
         return all(O3_mini_high_round_5.is_separator_cell(cell) for cell in cells if cell.strip())
 
+    @staticmethod
+    def is_separator_line(line):
+        # Anything left after deleting '-', ':', '|' and whitespace rules the
+        # line out in one C-level pass; only candidates get split into cells.
+        rest = line.translate(_SEPARATOR_ROW_CHARS)
+        if rest and not rest.isspace():
+            return False
+        return O3_mini_high_round_5.is_separator_row(_parse_row_cached(line))
+
     @staticmethod
     def is_valid_table(lines):
         if len(lines) < 2:
             return False
-        rows = [O3_mini_high_round_5.parse_row(ln) for ln in lines if '|' in ln]
+        rows = [_parse_row_cached(ln) for ln in lines if '|' in ln]
         if len(rows) < 2 or not O3_mini_high_round_5.is_separator_row(rows[1]):
             return False
         col_count = len(rows[0])
         return all(len(r) == col_count for r in rows)
 
-    @staticmethod
-    def normalize_row(row, target):
-        if len(row) < target:
-            return row + [''] * (target - len(row))
-        elif len(row) > target:
-            return row[:target-1] + [" ".join(row[target-1:])]
-        return row
-
     @staticmethod
     def get_table_style(line):
         s = line.strip()
         return (s.startswith('|'), s.endswith('|'))
 
     @staticmethod
-    def rebuild_row(cells, lead, trail):
-        row = " | ".join(cells)
+    @functools.lru_cache(maxsize=None)
+    def make_rebuilder(lead, trail):
+        # One branch-free builder per pipe style. Padding is appended here
+        # rather than on the cell list, so short rows never need a padded
+        # copy just to be joined.
+        if lead and trail:
+            return lambda cells, pad=0: "| " + " | ".join(cells) + " | " * pad + " |"
         if lead:
-            row = "| " + row
+            return lambda cells, pad=0: "| " + " | ".join(cells) + " | " * pad
         if trail:
-            row = row + " |"
-        return row
+            return lambda cells, pad=0: " | ".join(cells) + " | " * pad + " |"
+        return lambda cells, pad=0: " | ".join(cells) + " | " * pad
 
     @staticmethod
-    def detect_table_pattern(rows):
-        sep_idx = [i for i, r in enumerate(rows) if O3_mini_high_round_5.is_separator_row(r)]
+    def detect_table_pattern(rows, sep_flags=None):
+        if sep_flags is None:
+            sep_flags = [O3_mini_high_round_5.is_separator_row(r) for r in rows]
+        sep_idx = [i for i, is_sep in enumerate(sep_flags) if is_sep]
         if len(sep_idx) >= 2 and all(i % 2 == 1 for i in sep_idx):
             return 'separator_after_each'
         return 'standard'
 
     @staticmethod
     def fix_table_block(lines):
-        parsed = [O3_mini_high_round_5.parse_row(ln) for ln in lines if '|' in ln]
+        table_lines = [ln for ln in lines if '|' in ln]
+        # Rows are only read from here on, so the cached tuples are used as-is
+        parsed = [_parse_row_cached(ln) for ln in table_lines]
+        if not parsed:
+            return []
         style = O3_mini_high_round_5.get_table_style(lines[0])
-        max_cols = max(len(r) for r in parsed) if parsed else 0
-        norm = [O3_mini_high_round_5.normalize_row(r, max_cols) for r in parsed]
-        pattern = O3_mini_high_round_5.detect_table_pattern(norm)
+        # Every row is at most max_cols wide, so normalizing only ever pads;
+        # that padding is deferred to the row builder.
+        max_cols = max(len(r) for r in parsed)
+        rebuild = O3_mini_high_round_5.make_rebuilder(*style)
+        sep_row = rebuild(('---',) * max_cols)
+        header = rebuild(parsed[0], max_cols - len(parsed[0]))
+        if len(parsed) == 1:
+            return [header, sep_row]
         
-        fixed = []
-        sep_row = O3_mini_high_round_5.rebuild_row(['---'] * max_cols, *style)
+        # Empty padding cells don't affect separator detection
+        sep_flags = [O3_mini_high_round_5.is_separator_line(ln) for ln in table_lines]
+        pattern = O3_mini_high_round_5.detect_table_pattern(parsed, sep_flags)
+        data_rows = [r for r, is_sep in zip(parsed[1:], sep_flags[1:]) if not is_sep]
         
         if pattern == 'separator_after_each':
-            fixed.append(O3_mini_high_round_5.rebuild_row(norm[0], *style))
-            fixed.append(sep_row)
-            i = 1
-            while i < len(norm):
-                if O3_mini_high_round_5.is_separator_row(norm[i]):
-                    i += 1
-                    continue
-                fixed.append(O3_mini_high_round_5.rebuild_row(norm[i], *style))
-                fixed.append(sep_row)
-                i += 1
+            body = itertools.chain.from_iterable(
+                (rebuild(r, max_cols - len(r)), sep_row) for r in data_rows
+            )
         else:
-            fixed.append(O3_mini_high_round_5.rebuild_row(norm[0], *style))
-            fixed.append(sep_row)
-            for r in norm[1:]:
-                if O3_mini_high_round_5.is_separator_row(r):
-                    continue
-                fixed.append(O3_mini_high_round_5.rebuild_row(r, *style))
+            body = [rebuild(r, max_cols - len(r)) for r in data_rows]
         
-        return fixed
+        return [header, sep_row, *body]
 
 
-# Main script to process a markdown file with all algorithms
-if __name__ == "__main__":
-    def process_file_with_all_fixers(input_file):
-        """
-        Process an input file with all table fixing implementations
-        and save the results to separate output files.
+# Document being fixed, handed to each worker process once by init_fixer_worker
+# so it is not pickled again for every task
+_worker_content = None
+
+
+def init_fixer_worker(content):
+    """
+    Process pool initializer that stores the document for run_worker_fixer.
+    
+    Args:
+        content (str): The markdown text every task in this worker will fix
+    """
+    global _worker_content
+    _worker_content = content
+
+
+def run_fixer(name, impl, output_file, content):
+    """
+    Run one table fixing implementation over a document and save the result.
+    
+    Defined at module level so it can be dispatched to worker processes.
+    
+    Args:
+        name (str): Name of the implementation, used in reports
+        impl (type): Implementation class with a fix_invalid_markdown_tables method
+        output_file (str): Path the fixed markdown is written to
+        content (str): The markdown text to fix
+        
+    Returns:
+        tuple: (name, output_file, processing time in nanoseconds or None, error message or None)
+    """
+    try:
+        # Start every implementation cold so timings don't depend on run order
+        _parse_row_cached.cache_clear()
+        
+        # Process with this implementation
+        start_time = time.perf_counter_ns()
+        fixed_content = impl.fix_invalid_markdown_tables(content)
+        end_time = time.perf_counter_ns()
+        
+        # Save the result
+        with open(output_file, 'wb') as f:
+            f.write(fixed_content.encode('utf-8'))
+    except Exception as e:
+        return name, output_file, None, str(e)
+    
+    return name, output_file, end_time - start_time, None
+
+
+def run_worker_fixer(name, impl, output_file):
+    """
+    Pool task that runs run_fixer on the document stored by init_fixer_worker.
+    
+    Args:
+        name (str): Name of the implementation, used in reports
+        impl (type): Implementation class with a fix_invalid_markdown_tables method
+        output_file (str): Path the fixed markdown is written to
         
-        Args:
-            input_file (str): Path to the input markdown file
-        """
-        print(f"Processing {input_file} with all markdown table fixers...")
-        
-        # Read the input file
-        try:
-            with open(input_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            print(f"Error reading file {input_file}: {e}")
-            return
-        
-        # Process with each implementation
-        implementations = {
-            "claude37_round_1": Claude37_round_1,
-            "claude37_round_2": Claude37_round_2,
-            "claude37_round_3": Claude37_round_3,
-            "claude37_round_4": Claude37_round_4,
-            "claude37_round_5": Claude37_round_5,
-            "grok3_round_1": Grok3_round_1,
-            "grok3_round_2": Grok3_round_2,
-            "grok3_round_3": Grok3_round_3,
-            "grok3_round_4": Grok3_round_4,
-            "grok3_round_5": Grok3_round_5,
-            "o1_pro_round_1": O1_pro_round_1,
-            "o1_pro_round_2": O1_pro_round_2,
-            "o1_pro_round_3": O1_pro_round_3,
-            "o1_pro_round_4": O1_pro_round_4,
-            "o1_pro_round_5": O1_pro_round_5,
-            "o3_mini_high_round_1": O3_mini_high_round_1,
-            "o3_mini_high_round_2": O3_mini_high_round_2,
-            "o3_mini_high_round_3": O3_mini_high_round_3,
-            "o3_mini_high_round_4": O3_mini_high_round_4,
-            "o3_mini_high_round_5": O3_mini_high_round_5
-        }
+    Returns:
+        tuple: The result of run_fixer
+    """
+    if _worker_content is None:
+        raise RuntimeError("run_worker_fixer called outside a pool initialized by init_fixer_worker")
+    return run_fixer(name, impl, output_file, _worker_content)
+
+
+def process_file_with_all_fixers(input_file, jobs=None):
+    """
+    Process an input file with all table fixing implementations
+    and save the results to separate output files.
+    
+    This is also the library entry point: callers can import and call it
+    directly rather than running this script in a subprocess.
+    
+    Args:
+        input_file (str): Path to the input markdown file
+        jobs (int, optional): Number of worker processes to run the
+            implementations in. Defaults to the CPU count; 1 runs them
+            sequentially in this process.
+            
+    Returns:
+        list: One (name, output_file, processing time in nanoseconds or None,
+        error message or None) tuple per implementation, in implementation order
+        
+    Raises:
+        OSError, UnicodeDecodeError: If the input file cannot be read
+    """
+    # Read the input file
+    with open(input_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    # Process with each implementation
+    implementations = {
+        "claude37_round_1": Claude37_round_1,
+        "claude37_round_2": Claude37_round_2,
+        "claude37_round_3": Claude37_round_3,
+        "claude37_round_4": Claude37_round_4,
+        "claude37_round_5": Claude37_round_5,
+        "grok3_round_1": Grok3_round_1,
+        "grok3_round_2": Grok3_round_2,
+        "grok3_round_3": Grok3_round_3,
+        "grok3_round_4": Grok3_round_4,
+        "grok3_round_5": Grok3_round_5,
+        "o1_pro_round_1": O1_pro_round_1,
+        "o1_pro_round_2": O1_pro_round_2,
+        "o1_pro_round_3": O1_pro_round_3,
+        "o1_pro_round_4": O1_pro_round_4,
+        "o1_pro_round_5": O1_pro_round_5,
+        "o3_mini_high_round_1": O3_mini_high_round_1,
+        "o3_mini_high_round_2": O3_mini_high_round_2,
+        "o3_mini_high_round_3": O3_mini_high_round_3,
+        "o3_mini_high_round_4": O3_mini_high_round_4,
+        "o3_mini_high_round_5": O3_mini_high_round_5
+    }
+    
+    output_base = input_file.rsplit('.', 1)[0]
+    tasks = [
+        (name, impl, f"{output_base}__fixed_tables__{name}.md")
+        for name, impl in implementations.items()
+    ]
+    
+    if jobs == 1:
+        return [run_fixer(*task, content) for task in tasks]
+    else:
+        # The implementations are independent CPU-bound passes over the
+        # same text, so they run in separate processes; each worker gets
+        # the text once up front and writes its own output files
+        with ProcessPoolExecutor(max_workers=jobs, initializer=init_fixer_worker,
+                                 initargs=(content,)) as executor:
+            # map yields results in task order, so they stay in the fixed
+            # implementation order whichever worker finishes first
+            return list(executor.map(run_worker_fixer, *zip(*tasks)))
+
+
+def positive_int(value):
+    """
+    argparse type for options that need a whole number of at least 1.
+    
+    Args:
+        value (str): The raw command line value
         
-        for name, impl in implementations.items():
-            try:
-                # Process with this implementation
-                start_time = __import__('time').time()
-                fixed_content = impl.fix_invalid_markdown_tables(content)
-                end_time = __import__('time').time()
-                
-                # Save the result
-                output_file = f"{input_file.rsplit('.', 1)[0]}__fixed_tables__{name}.md"
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(fixed_content)
-                
-                # Report
-                processing_time = end_time - start_time
-                print(f"  {name}: Processed in {processing_time:.3f} seconds, saved to {output_file}")
-            except Exception as e:
-                print(f"  {name}: Error processing file: {e}")
+    Returns:
+        int: The parsed value
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+# Main script to process a markdown file with all algorithms
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fix invalid markdown tables with every tournament implementation.")
+    parser.add_argument("input_file", nargs="?", default="sample_10k_reformatted.md",
+                        help="Markdown file to process (default: sample_10k_reformatted.md)")
+    parser.add_argument("--jobs", type=positive_int, default=None,
+                        help="Number of worker processes (default: CPU count; 1 runs sequentially)")
+    args = parser.parse_args()
     
     # Process the specified file
-    input_file = "sample_10k_reformatted.md"
-    process_file_with_all_fixers(input_file)
\ No newline at end of file
+    print(f"Processing {args.input_file} with all markdown table fixers...")
+    try:
+        results = process_file_with_all_fixers(args.input_file, jobs=args.jobs)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error reading file {args.input_file}: {e}")
+        results = []
+    
+    # Report
+    for name, output_file, processing_time_ns, error in results:
+        if error is not None:
+            print(f"  {name}: Error processing file: {error}")
+        else:
+            print(f"  {name}: Processed in {processing_time_ns / 1e9:.3f} seconds, saved to {output_file}")
\ No newline at end of file